@@ -70,7 +70,7 @@ export const upload = async (
     }
 
     messageTransport.debug("Launching browser...");
-    await launchBrowser(puppeteerLaunch, useCookieStore)
+    await launchBrowser(puppeteerLaunch, useCookieStore, messageTransport)
     messageTransport.debug("Browser successfully launched");
 
     try {
@@ -279,7 +279,6 @@ async function uploadVideo(videoJSON: Video, messageTransport: MessageTransport)
     await textBoxes[0].evaluate((e) => ((e as any).__shady_native_textContent = ''))
     await textBoxes[0].type(title.substring(0, maxTitleLen))
     // Add the Description content
-    await textBoxes[0].evaluate((e) => ((e as any).__shady_native_textContent = ''))
     await textBoxes[1].type(description.substring(0, maxDescLen));
 
     messageTransport.debug(`  >> ${videoJSON.title} - Title and description set`);
@@ -529,11 +528,19 @@ async function uploadVideo(videoJSON: Video, messageTransport: MessageTransport)
     await page.waitForSelector(uploadLinkSelector)
     const uploadedLinkHandle = await page.$(uploadLinkSelector)
 
-    let uploadedLink
-    do {
-        await page.waitForTimeout(500)
-        uploadedLink = await page.evaluate((e) => e.getAttribute('href'), uploadedLinkHandle)
-    } while (uploadedLink === videoBaseLink || uploadedLink === shortVideoBaseLink)
+    // Resolve as soon as the href gets the video id instead of polling every 500ms
+    const uploadedLinkResult = await page.waitForFunction(
+        (e: Element, videoBaseLink: string, shortVideoBaseLink: string) => {
+            const href = e.getAttribute('href')
+            // Wrap the href so a missing attribute (null) still ends the wait
+            return href !== videoBaseLink && href !== shortVideoBaseLink ? { href } : null
+        },
+        { polling: 'mutation', timeout: 0 },
+        uploadedLinkHandle,
+        videoBaseLink,
+        shortVideoBaseLink
+    )
+    const { href: uploadedLink } = await uploadedLinkResult.jsonValue<{ href: string }>()
 
     const closeDialogXPath = uploadAsDraft ? saveCloseBtnXPath : publishXPath
     let closeDialog
@@ -596,9 +603,10 @@ export const update = async (
             .replace(/\./g, '_')}.json`
     )
 
-    await launchBrowser(puppeteerLaunch)
-    if (!fs.existsSync(cookiesFilePath)) await loadAccount(credentials, messageTransport)
+    await launchBrowser(puppeteerLaunch, true, messageTransport)
+    if (!(await fs.pathExists(cookiesFilePath))) await loadAccount(credentials, messageTransport)
     const updatedYTLink = []
+    lastSelectedChannel = ''
 
     for (const video of videos) {
         messageTransport.log(video)
@@ -629,8 +637,8 @@ export const comment = async (
             .replace(/\./g, '_')}.json`
     )
 
-    await launchBrowser(puppeteerLaunch)
-    if (!fs.existsSync(cookiesFilePath)) await loadAccount(credentials, messageTransport)
+    await launchBrowser(puppeteerLaunch, true, messageTransport)
+    if (!(await fs.pathExists(cookiesFilePath))) await loadAccount(credentials, messageTransport)
     const commentsS = []
 
     for (const comment of comments) {
@@ -816,8 +824,9 @@ const updateVideoInfo = async (videoJSON: VideoToEdit, messageTransport: Message
         throw new Error('The link of the  video is a required parameter')
     }
 
-    if (videoJSON.channelName) {
+    if (videoJSON.channelName && videoJSON.channelName !== lastSelectedChannel) {
         await changeChannel(videoJSON.channelName)
+        lastSelectedChannel = videoJSON.channelName
     }
 
     const title = videoJSON.title
@@ -1021,7 +1030,7 @@ async function loadAccount(
     useCookieStore: boolean = true
 ) {
     try {
-        if (!fs.existsSync(cookiesFilePath) || !useCookieStore)
+        if (!useCookieStore || !(await fs.pathExists(cookiesFilePath)))
             await login(page, credentials, messageTransport, useCookieStore)
     } catch (error: any) {
         if (error.message === 'Recapcha found') {
@@ -1149,22 +1158,36 @@ async function changeHomePageLangIfNeeded(localPage: Page) {
     await changeHomePageLangIfNeeded(localPage)
 }
 
-async function launchBrowser(puppeteerLaunch?: PuppeteerNodeLaunchOptions, loadCookies: boolean = true) {
+async function launchBrowser(
+    puppeteerLaunch?: PuppeteerNodeLaunchOptions,
+    loadCookies: boolean = true,
+    messageTransport: MessageTransport = defaultMessageTransport
+) {
     browser = await puppeteer.launch(puppeteerLaunch)
     page = await browser.newPage()
     await page.setDefaultTimeout(timeout)
 
     if (loadCookies) {
-        const previousSession = fs.existsSync(cookiesFilePath)
+        const previousSession = await fs.pathExists(cookiesFilePath)
 
         if (previousSession) {
             // If file exist load the cookies
-            const cookiesString = fs.readFileSync(cookiesFilePath, { encoding: 'utf-8' })
-            const parsedCookies = JSON.parse(cookiesString)
+            const cookiesString = await fs.readFile(cookiesFilePath, { encoding: 'utf-8' })
+            let parsedCookies: any[] = []
+            try {
+                parsedCookies = JSON.parse(cookiesString)
+                if (!Array.isArray(parsedCookies)) throw new Error('Stored cookies are not an array')
+            } catch (err) {
+                // Remove the corrupt store so the pathExists checks send every entry point through login
+                messageTransport.warn(
+                    `Could not parse stored cookies in ${cookiesFilePath}, logging in again. Error: ${err}`
+                )
+                await fs.remove(cookiesFilePath)
+                parsedCookies = []
+            }
             if (parsedCookies.length !== 0) {
-                for (let cookie of parsedCookies) {
-                    await page.setCookie(cookie)
-                }
+                // Set all cookies in a single call instead of one round trip per cookie
+                await page.setCookie(...parsedCookies)
             }
         }
     }
@@ -1281,14 +1304,14 @@ async function login(
 
     if (useCookieStore) {
         const cookiesObject = await localPage.cookies()
-        await fs.mkdirSync(cookiesDirPath, { recursive: true })
+        await fs.ensureDir(cookiesDirPath)
         // Write cookies to temp file to be used in other profile pages
-        await fs.writeFile(cookiesFilePath, JSON.stringify(cookiesObject), function (err) {
-            if (err) {
-                messageTransport.log('The file could not be written. ' + err.message)
-            }
+        try {
+            await fs.writeFile(cookiesFilePath, JSON.stringify(cookiesObject))
             messageTransport.log('Session has been successfully saved')
-        })
+        } catch (err: any) {
+            messageTransport.log('The file could not be written. ' + err.message)
+        }
     } else {
         messageTransport.log('Account logged in successfully')
     }
@@ -1458,13 +1481,18 @@ async function selectGame(page: Page, gameTitle: string, messageTransport: Messa
     }
 
     const buttonOptions = await optionsPopupHost.$$('.selectable-item')
+    // Read every option's test-id from the same handles in one round trip instead of one per button.
+    const testIds = await page.evaluate(
+        (...elements: Element[]) => elements.map((el) => el.getAttribute('test-id')),
+        ...buttonOptions
+    )
 
     // Check if we should select the option.
     let pressed = false
     for (let i = 0; i < buttonOptions.length; i++) {
         const button = buttonOptions[i]
 
-        let testId = await button.evaluate((el: Element) => el.getAttribute('test-id'))
+        let testId = testIds[i]
         if (testId == null || !testId.startsWith(`{"title"`)) continue
 
         let gameData = JSON.parse(testId) as GameData